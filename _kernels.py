@@ -0,0 +1,31 @@
+"""
+Numba-compiled kernels for Smart Shopping List.
+Optional: only imported when Numba is installed, see shopping_list.py.
+"""
+
+import math
+
+import numpy as np
+from numba import njit, prange
+
+
+# fastmath is left off on purpose: it lets Numba assume there are no NaNs,
+# which would drop the missing-price check below.
+@njit(parallel=True, cache=True)
+def store_totals(prices, quantities):
+    """
+    Total each row of the stores x items price matrix against the quantities.
+    Returns one total per store, infinity for stores with a NaN (missing) price.
+    """
+    n_stores, n_items = prices.shape
+    totals = np.empty(n_stores)
+    for s in prange(n_stores):
+        total = 0.0
+        for i in range(n_items):
+            price = prices[s, i]
+            if math.isnan(price):
+                total = math.inf
+                break
+            total += price * quantities[i]
+        totals[s] = total
+    return totals
@@ -5,21 +5,30 @@ Provides an interactive way to manage offices, supplies, and stores.
 """
 
 import sys
-from shopping_list import Office, Store, SmartShoppingList
+from shopping_list import Office, Store, SmartShoppingList, load_sample_data
 
 
 def print_header(text):
     """Print a formatted header."""
-    print("\n" + "=" * 60)
-    print(text)
-    print("=" * 60)
+    rule = "=" * 60
+    sys.stdout.write(f"\n{rule}\n{text}\n{rule}\n")
+
+
+def ask(prompt):
+    """Prompt for one line of input; like input() but reads stdin directly."""
+    sys.stdout.write(prompt)
+    sys.stdout.flush()
+    line = sys.stdin.readline()
+    if not line:
+        raise EOFError
+    return line.rstrip('\n')
 
 
 def add_office_interactive(smart_list):
     """Interactively add an office and its supplies."""
     print_header("ADD OFFICE")
     
-    office_name = input("Enter office name: ").strip()
+    office_name = ask("Enter office name: ").strip()
     if not office_name:
         print("Office name cannot be empty.")
         return
@@ -30,7 +39,7 @@ def add_office_interactive(smart_list):
     print("Enter items (type 'done' when finished):")
     
     while True:
-        item_name = input("  Item name (or 'done'): ").strip()
+        item_name = ask("  Item name (or 'done'): ").strip()
         if item_name.lower() == 'done':
             break
         
@@ -39,7 +48,7 @@ def add_office_interactive(smart_list):
             continue
         
         try:
-            quantity = int(input(f"  Quantity for {item_name}: "))
+            quantity = int(ask(f"  Quantity for {item_name}: "))
             if quantity <= 0:
                 print("  Quantity must be positive.")
                 continue
@@ -56,7 +65,7 @@ def add_store_interactive(smart_list):
     """Interactively add a store and its prices."""
     print_header("ADD STORE")
     
-    store_name = input("Enter store name: ").strip()
+    store_name = ask("Enter store name: ").strip()
     if not store_name:
         print("Store name cannot be empty.")
         return
@@ -67,7 +76,7 @@ def add_store_interactive(smart_list):
     print("Enter item prices (type 'done' when finished):")
     
     while True:
-        item_name = input("  Item name (or 'done'): ").strip()
+        item_name = ask("  Item name (or 'done'): ").strip()
         if item_name.lower() == 'done':
             break
         
@@ -76,7 +85,7 @@ def add_store_interactive(smart_list):
             continue
         
         try:
-            price = float(input(f"  Price for {item_name}: $"))
+            price = float(ask(f"  Price for {item_name}: $"))
             if price < 0:
                 print("  Price cannot be negative.")
                 continue
@@ -98,8 +107,10 @@ def show_results(smart_list):
         print("\nNo supplies added yet.")
         return
     
+    sorted_items = sorted(merged.items())  # shared by the list and the breakdown
+    
     print("\nMerged Shopping List from All Offices:")
-    for item, quantity in sorted(merged.items()):
+    for item, quantity in sorted_items:
         print(f"  • {item}: {quantity}")
     
     if not smart_list.stores:
@@ -109,12 +120,18 @@ def show_results(smart_list):
     print_header("PRICE COMPARISON")
     
     comparison = smart_list.get_price_comparison()
-    for store_name, data in sorted(comparison.items()):
+    # Track the most expensive complete store while printing, for the savings line
+    max_cost = 0.0
+    complete_stores = 0
+    for store_name, data in comparison.items():
         print(f"\n{store_name}:")
         if data['unavailable_items']:
             print(f"  Status: ⚠ Missing items - {', '.join(data['unavailable_items'])}")
         else:
             print(f"  Total Cost: ${data['total']:.2f}")
+        if data['total'] != float('inf'):
+            max_cost = max(max_cost, data['total'])
+            complete_stores += 1
     
     print_header("CHEAPEST OPTION")
     
@@ -125,18 +142,14 @@ def show_results(smart_list):
         print(f"Total Cost: ${total:.2f}")
         
         print("\nItemized Breakdown:")
-        for item, quantity in sorted(merged.items()):
-            price = cheapest_store.get_price(item)
+        prices = cheapest_store.prices  # the cheapest store carries every item
+        for item, quantity in sorted_items:
+            price = prices[item]
             subtotal = price * quantity
             print(f"  • {item}: {quantity} × ${price:.2f} = ${subtotal:.2f}")
         
         # Calculate savings
-        all_totals = [
-            data['total'] for data in comparison.values()
-            if data['total'] != float('inf')
-        ]
-        if len(all_totals) > 1:
-            max_cost = max(all_totals)
+        if complete_stores > 1:
             savings = max_cost - total
             if savings > 0:
                 savings_pct = (savings / max_cost) * 100
@@ -149,9 +162,7 @@ def main_menu():
     """Display and handle the main menu."""
     smart_list = SmartShoppingList()
     
-    print("\n" + "=" * 60)
-    print("SMART SHOPPING LIST - Multi-Office Management System")
-    print("=" * 60)
+    print_header("SMART SHOPPING LIST - Multi-Office Management System")
     
     while True:
         print("\n" + "-" * 60)
@@ -163,7 +174,7 @@ def main_menu():
         print("  5. Exit")
         print("-" * 60)
         
-        choice = input("\nEnter your choice (1-5): ").strip()
+        choice = ask("\nEnter your choice (1-5): ").strip()
         
         if choice == '1':
             add_office_interactive(smart_list)
@@ -181,61 +192,6 @@ def main_menu():
             print("\n⚠ Invalid choice. Please enter 1-5.")
 
 
-def load_sample_data(smart_list):
-    """Load sample data for demonstration."""
-    # Create 4 offices
-    office1 = Office("Office 1 - New York")
-    office1.add_item("Pens", 10)
-    office1.add_item("Paper Reams", 5)
-    office1.add_item("Staplers", 2)
-    
-    office2 = Office("Office 2 - Boston")
-    office2.add_item("Pens", 15)
-    office2.add_item("Paper Reams", 3)
-    office2.add_item("Folders", 20)
-    
-    office3 = Office("Office 3 - Chicago")
-    office3.add_item("Paper Reams", 7)
-    office3.add_item("Folders", 10)
-    office3.add_item("Markers", 8)
-    
-    office4 = Office("Office 4 - Seattle")
-    office4.add_item("Staplers", 3)
-    office4.add_item("Markers", 12)
-    office4.add_item("Pens", 5)
-    
-    smart_list.add_office(office1)
-    smart_list.add_office(office2)
-    smart_list.add_office(office3)
-    smart_list.add_office(office4)
-    
-    # Create stores
-    store_a = Store("Office Depot")
-    store_a.set_price("Pens", 1.50)
-    store_a.set_price("Paper Reams", 8.00)
-    store_a.set_price("Staplers", 5.00)
-    store_a.set_price("Folders", 0.50)
-    store_a.set_price("Markers", 2.00)
-    
-    store_b = Store("Staples")
-    store_b.set_price("Pens", 1.25)
-    store_b.set_price("Paper Reams", 8.50)
-    store_b.set_price("Staplers", 4.50)
-    store_b.set_price("Folders", 0.60)
-    store_b.set_price("Markers", 1.75)
-    
-    store_c = Store("Amazon")
-    store_c.set_price("Pens", 1.00)
-    store_c.set_price("Paper Reams", 7.50)
-    store_c.set_price("Staplers", 4.00)
-    store_c.set_price("Folders", 0.45)
-    store_c.set_price("Markers", 1.80)
-    
-    smart_list.add_store(store_a)
-    smart_list.add_store(store_b)
-    smart_list.add_store(store_c)
-
-
 if __name__ == "__main__":
     try:
         main_menu()
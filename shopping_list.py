@@ -4,40 +4,86 @@ Smart Shopping List Application
 Manages supplies for multiple offices, merges them, and finds the cheapest store.
 """
 
-from collections import defaultdict
-from typing import Dict, List, Tuple
+import sys
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; the pure Python path is used without it
+    np = None
+
+# Numba kernel, imported on first use so startup never pays for importing Numba:
+# False = not tried yet, None = unavailable
+_jit_store_totals = False
+
+_INF = float('inf')
+
+# Below this many (store, item) pairs the pure Python loop beats NumPy's setup cost
+_NUMPY_MIN_CELLS = 1000
+
+# From this many (store, item) pairs on, the compiled kernel beats plain NumPy
+_JIT_MIN_CELLS = 10000
+
+
+def _load_jit_store_totals():
+    """Import the Numba store-total kernel on first use; None if Numba is missing."""
+    global _jit_store_totals
+    if _jit_store_totals is False:
+        try:
+            from _kernels import store_totals
+        except ImportError:  # Numba is optional too; NumPy handles large catalogs without it
+            store_totals = None
+        _jit_store_totals = store_totals
+    return _jit_store_totals
 
 
 class Office:
     """Represents an office with its supply needs."""
     
+    __slots__ = ('name', 'supplies', '_revision')
+    
     def __init__(self, name: str):
         self.name = name
-        self.supplies = defaultdict(int)  # item_name -> quantity
+        # item_name -> quantity; read freely, but change it only through add_item()
+        # so SmartShoppingList notices the change and drops its cached results
+        self.supplies = {}
+        self._revision = 0  # bumped on every change, used for cache invalidation
     
     def add_item(self, item: str, quantity: int = 1):
         """Add an item to this office's supply list."""
-        self.supplies[item] += quantity
+        item = sys.intern(item)  # shared key objects make store price lookups cheaper
+        self.supplies[item] = self.supplies.get(item, 0) + quantity
+        self._revision += 1
     
-    def get_supplies(self) -> Dict[str, int]:
-        """Get all supplies for this office."""
-        return dict(self.supplies)
+    def get_supplies(self) -> Mapping[str, int]:
+        """
+        Get all supplies for this office as a read-only view.
+        No copy is made, so the view reflects items added later.
+        """
+        return MappingProxyType(self.supplies)
 
 
 class Store:
     """Represents a store with its prices."""
     
+    __slots__ = ('name', 'prices', '_revision')
+    
     def __init__(self, name: str):
         self.name = name
-        self.prices = {}  # item_name -> price
+        # item_name -> price; read freely, but change it only through set_price()
+        # so SmartShoppingList notices the change and drops its cached results
+        self.prices = {}
+        self._revision = 0  # bumped on every change, used for cache invalidation
     
     def set_price(self, item: str, price: float):
         """Set the price for an item."""
-        self.prices[item] = price
+        self.prices[sys.intern(item)] = price
+        self._revision += 1
     
     def get_price(self, item: str) -> float:
         """Get the price of an item, return infinity if not available."""
-        return self.prices.get(item, float('inf'))
+        return self.prices.get(item, _INF)
 
 
 class SmartShoppingList:
@@ -46,43 +92,209 @@ class SmartShoppingList:
     def __init__(self):
         self.offices = []
         self.stores = []
+        self._merged_cache = None
+        self._merged_revision = 0
+        self._all_cache = None
+        self._all_revision = (0, 0)
+        self._item_index = None
+        self._item_index_revision = 0
+        # Final query results, valid while compute_all() returns the same tuple
+        self._comparison_cache = None
+        self._comparison_source = None
+        self._cheapest_cache = None
+        self._cheapest_source = None
     
     def add_office(self, office: Office):
         """Add an office to the system."""
         self.offices.append(office)
+        self._merged_cache = None
+        self._all_cache = None
+        self._comparison_cache = None
+        self._cheapest_cache = None
     
     def add_store(self, store: Store):
         """Add a store to the system."""
         self.stores.append(store)
+        self._all_cache = None
+        self._item_index = None
+        self._comparison_cache = None
+        self._cheapest_cache = None
     
     def merge_supplies(self) -> Dict[str, int]:
-        """Merge supplies from all offices into one consolidated list."""
-        merged = defaultdict(int)
+        """
+        Merge supplies from all offices into one consolidated list.
+        The result is cached until an office is added or changed; do not mutate it.
+        """
+        revision = sum(office._revision for office in self.offices)
+        if self._merged_cache is not None and self._merged_revision == revision:
+            return self._merged_cache
+        
+        merged = {}
         for office in self.offices:
-            for item, quantity in office.get_supplies().items():
-                merged[item] += quantity
-        return dict(merged)
+            for item, quantity in office.supplies.items():
+                merged[item] = merged.get(item, 0) + quantity
+        
+        self._merged_cache = merged
+        self._merged_revision = revision
+        return self._merged_cache
     
-    def calculate_store_total(self, store: Store, shopping_list: Dict[str, int]) -> Tuple[float, List[str]]:
-        """Calculate total cost for a store and identify unavailable items."""
+    def calculate_store_total(self, store: Store, shopping_list: Dict[str, int],
+                              budget: float = _INF) -> Tuple[float, List[str]]:
+        """
+        Calculate total cost for a store and identify unavailable items.
+        Stops early once the running total reaches budget; the returned total is
+        then only a lower bound and the unavailable list may be incomplete.
+        """
         total = 0.0
         unavailable = []
+        get_price = store.prices.get
         
         for item, quantity in shopping_list.items():
-            price = store.get_price(item)
-            if price == float('inf'):
+            price = get_price(item)
+            if price is None or price == _INF:  # an infinite price means not available
                 unavailable.append(item)
             else:
                 total += price * quantity
+                if total >= budget:
+                    break
         
         return total, unavailable
     
-    def find_cheapest_store(self) -> Tuple[Store, float, Dict[str, int]]:
+    def price_matrix(self, merged_list: Optional[Dict[str, int]] = None):
+        """
+        Build NumPy arrays for the merged shopping list (requires NumPy).
+        Returns: (items, quantities, prices) where prices has one row per store
+        and NaN for items the store does not carry.
+        """
+        if np is None:
+            raise RuntimeError("price_matrix() requires NumPy")
+        if merged_list is None:
+            merged_list = self.merge_supplies()
+        
+        items = list(merged_list)
+        columns = {item: col for col, item in enumerate(items)}
+        quantities = np.fromiter(merged_list.values(), dtype=np.float64, count=len(items))
+        prices = np.full((len(self.stores), len(items)), np.nan)
+        
+        for row, store in zip(prices, self.stores):
+            cols = []
+            values = []
+            for item, price in store.prices.items():
+                col = columns.get(item)
+                if col is not None and price != _INF:  # infinite price = missing (NaN)
+                    cols.append(col)
+                    values.append(price)
+            row[cols] = values
+        
+        return items, quantities, prices
+    
+    def _use_numpy(self, merged_list: Dict[str, int]) -> bool:
+        """Check whether the vectorized path is available and worth it."""
+        return np is not None and len(self.stores) * len(merged_list) >= _NUMPY_MIN_CELLS
+    
+    def _vectorized_totals(self, merged_list: Dict[str, int]):
+        """
+        Compute every store's total in one matrix-vector product, or with the
+        compiled kernel for very large catalogs.
+        Returns: (items, prices, totals) where totals is inf for incomplete stores.
+        """
+        items, quantities, prices = self.price_matrix(merged_list)
+        jit_store_totals = _load_jit_store_totals() if prices.size >= _JIT_MIN_CELLS else None
+        if jit_store_totals is not None:
+            totals = jit_store_totals(prices, quantities)
+        else:
+            missing = np.isnan(prices)
+            totals = np.where(missing.any(axis=1), np.inf, np.where(missing, 0.0, prices) @ quantities)
+        return items, prices, totals
+    
+    def compute_all(self) -> Tuple[Dict[str, int], Dict[Store, float], Dict[Store, List[str]]]:
+        """
+        Merge supplies and total every store for the merged list.
+        Returns: (merged_shopping_list, store_totals, store_unavailable_items), where
+        a store's total is infinity if it misses any item. The result is cached
+        until an office or store is added or changed; do not mutate it.
+        """
+        revision = (sum(office._revision for office in self.offices),
+                    sum(store._revision for store in self.stores))
+        if self._all_cache is not None and self._all_revision == revision:
+            return self._all_cache
+        
+        stores = self.stores
+        merged = self.merge_supplies()
+        
+        if self._use_numpy(merged):
+            items, prices, totals_array = self._vectorized_totals(merged)
+            totals = dict(zip(stores, totals_array.tolist()))
+            unavailable = {
+                store: [items[col] for col in np.flatnonzero(row)]
+                for store, row in zip(stores, np.isnan(prices))
+            }
+        else:
+            totals, unavailable = self._indexed_totals(merged)
+        
+        self._all_cache = (merged, totals, unavailable)
+        self._all_revision = revision
+        return self._all_cache
+    
+    def _get_item_index(self) -> Dict[str, List[Tuple[Store, float]]]:
+        """
+        Get the inverted index mapping each item to the (store, price) pairs carrying it.
+        Rebuilt on first use after a store is added or changed.
+        """
+        revision = sum(store._revision for store in self.stores)
+        if self._item_index is None or self._item_index_revision != revision:
+            index = {}
+            for store in dict.fromkeys(self.stores):  # a store added twice is indexed once
+                for item, price in store.prices.items():
+                    if price != _INF:  # an infinite price means not available
+                        index.setdefault(item, []).append((store, price))
+            self._item_index = index
+            self._item_index_revision = revision
+        return self._item_index
+    
+    def _indexed_totals(self, merged_list: Dict[str, int]) -> Tuple[Dict[Store, float], Dict[Store, List[str]]]:
+        """
+        Total every store for merged_list, visiting only the prices stores actually have.
+        Returns: (store_totals, store_unavailable_items); incomplete stores total infinity.
+        """
+        index = self._get_item_index()
+        totals = dict.fromkeys(self.stores, 0.0)
+        carried = dict.fromkeys(self.stores, 0)
+        
+        for item, quantity in merged_list.items():
+            for store, price in index.get(item, ()):
+                totals[store] += price * quantity
+                carried[store] += 1
+        
+        return totals, self._find_unavailable(merged_list, totals, carried)
+    
+    def _find_unavailable(self, merged_list: Dict[str, int], totals: Dict[Store, float],
+                          carried: Dict[Store, int]) -> Dict[Store, List[str]]:
+        """List each store's missing items and set incomplete stores' totals to infinity."""
+        unavailable = {}
+        needed = len(merged_list)
+        for store in totals:
+            if carried[store] == needed:
+                unavailable[store] = []
+            else:
+                get_price = store.prices.get
+                unavailable[store] = [item for item in merged_list if get_price(item, _INF) == _INF]
+                totals[store] = _INF
+        return unavailable
+    
+    def find_cheapest_store(self, merged_list: Optional[Dict[str, int]] = None) -> Tuple[Store, float, Dict[str, int]]:
         """
         Find the store with the cheapest total for the merged shopping list.
+        Pass merged_list to price a different list than the offices' merged one;
+        otherwise the result is cached until an office or store changes.
         Returns: (cheapest_store, total_cost, merged_shopping_list)
         """
-        merged_list = self.merge_supplies()
+        totals = None
+        if merged_list is None:
+            results = self.compute_all()
+            if self._cheapest_cache is not None and self._cheapest_source is results:
+                return self._cheapest_cache
+            merged_list, totals, _ = results
         
         if not merged_list:
             return None, 0.0, {}
@@ -90,11 +302,29 @@ class SmartShoppingList:
         if not self.stores:
             return None, 0.0, merged_list
         
+        if totals is not None:
+            # Incomplete stores total infinity, so min() never prefers them
+            cheapest_store = min(totals, key=totals.get)
+            cheapest_total = totals[cheapest_store]
+            if cheapest_total == _INF:
+                cheapest_store = None
+            self._cheapest_cache = (cheapest_store, cheapest_total, merged_list)
+            self._cheapest_source = results
+            return self._cheapest_cache
+        
+        if self._use_numpy(merged_list):
+            _, _, totals = self._vectorized_totals(merged_list)
+            idx = int(np.argmin(totals))
+            if totals[idx] == _INF:
+                return None, _INF, merged_list
+            return self.stores[idx], float(totals[idx]), merged_list
+        
+        calc = self.calculate_store_total
         cheapest_store = None
-        cheapest_total = float('inf')
+        cheapest_total = _INF
         
         for store in self.stores:
-            total, unavailable = self.calculate_store_total(store, merged_list)
+            total, unavailable = calc(store, merged_list, cheapest_total)
             
             # Only consider stores that have all items
             if not unavailable and total < cheapest_total:
@@ -103,88 +333,98 @@ class SmartShoppingList:
         
         return cheapest_store, cheapest_total, merged_list
     
-    def get_price_comparison(self) -> Dict[str, Dict[str, float]]:
-        """Get a comparison of all stores and their total costs."""
-        merged_list = self.merge_supplies()
+    def get_price_comparison(self, merged_list: Optional[Dict[str, int]] = None) -> Dict[str, Dict[str, float]]:
+        """
+        Get a comparison of all stores and their total costs.
+        Without merged_list the result is cached until an office or store
+        changes; do not mutate it.
+        """
         comparison = {}
         
+        if merged_list is None:
+            results = self.compute_all()
+            if self._comparison_cache is not None and self._comparison_source is results:
+                return self._comparison_cache
+            _, totals, unavailable = results
+            for store in self.stores:
+                comparison[store.name] = {
+                    'total': totals[store],
+                    'unavailable_items': unavailable[store]
+                }
+            self._comparison_cache = comparison
+            self._comparison_source = results
+            return comparison
+        
+        if self._use_numpy(merged_list):
+            items, prices, totals = self._vectorized_totals(merged_list)
+            for store, total, row in zip(self.stores, totals.tolist(), np.isnan(prices)):
+                comparison[store.name] = {
+                    'total': total,
+                    'unavailable_items': [items[col] for col in np.flatnonzero(row)]
+                }
+            return comparison
+        
+        totals, unavailable = self._indexed_totals(merged_list)
         for store in self.stores:
-            total, unavailable = self.calculate_store_total(store, merged_list)
             comparison[store.name] = {
-                'total': total if not unavailable else float('inf'),
-                'unavailable_items': unavailable
+                'total': totals[store],
+                'unavailable_items': unavailable[store]
             }
         
         return comparison
 
 
+# Sample data: (office name, ((item, quantity), ...))
+_SAMPLE_OFFICES = (
+    ("Office 1 - New York", (("Pens", 10), ("Paper Reams", 5), ("Staplers", 2))),
+    ("Office 2 - Boston", (("Pens", 15), ("Paper Reams", 3), ("Folders", 20))),
+    ("Office 3 - Chicago", (("Paper Reams", 7), ("Folders", 10), ("Markers", 8))),
+    ("Office 4 - Seattle", (("Staplers", 3), ("Markers", 12), ("Pens", 5))),
+)
+
+# Sample data: (store name, ((item, price), ...))
+_SAMPLE_STORES = (
+    ("Office Depot", (("Pens", 1.50), ("Paper Reams", 8.00), ("Staplers", 5.00),
+                      ("Folders", 0.50), ("Markers", 2.00))),
+    ("Staples", (("Pens", 1.25), ("Paper Reams", 8.50), ("Staplers", 4.50),
+                 ("Folders", 0.60), ("Markers", 1.75))),
+    ("Amazon", (("Pens", 1.00), ("Paper Reams", 7.50), ("Staplers", 4.00),
+                ("Folders", 0.45), ("Markers", 1.80))),
+)
+
+
+def load_sample_data(smart_list: SmartShoppingList):
+    """Load sample data (4 offices, 3 stores) for demonstration."""
+    for name, items in _SAMPLE_OFFICES:
+        office = Office(name)
+        for item, quantity in items:
+            office.add_item(item, quantity)
+        smart_list.add_office(office)
+    
+    for name, prices in _SAMPLE_STORES:
+        store = Store(name)
+        for item, price in prices:
+            store.set_price(item, price)
+        smart_list.add_store(store)
+
+
 def demo():
     """Demo function to show how to use the Smart Shopping List."""
     
     # Create the smart shopping list system
     smart_list = SmartShoppingList()
     
-    # Create 4 offices
-    office1 = Office("Office 1 - New York")
-    office1.add_item("Pens", 10)
-    office1.add_item("Paper Reams", 5)
-    office1.add_item("Staplers", 2)
-    
-    office2 = Office("Office 2 - Boston")
-    office2.add_item("Pens", 15)
-    office2.add_item("Paper Reams", 3)
-    office2.add_item("Folders", 20)
-    
-    office3 = Office("Office 3 - Chicago")
-    office3.add_item("Paper Reams", 7)
-    office3.add_item("Folders", 10)
-    office3.add_item("Markers", 8)
-    
-    office4 = Office("Office 4 - Seattle")
-    office4.add_item("Staplers", 3)
-    office4.add_item("Markers", 12)
-    office4.add_item("Pens", 5)
-    
-    # Add offices to the system
-    smart_list.add_office(office1)
-    smart_list.add_office(office2)
-    smart_list.add_office(office3)
-    smart_list.add_office(office4)
-    
-    # Create stores with prices
-    store_a = Store("Office Depot")
-    store_a.set_price("Pens", 1.50)
-    store_a.set_price("Paper Reams", 8.00)
-    store_a.set_price("Staplers", 5.00)
-    store_a.set_price("Folders", 0.50)
-    store_a.set_price("Markers", 2.00)
-    
-    store_b = Store("Staples")
-    store_b.set_price("Pens", 1.25)
-    store_b.set_price("Paper Reams", 8.50)
-    store_b.set_price("Staplers", 4.50)
-    store_b.set_price("Folders", 0.60)
-    store_b.set_price("Markers", 1.75)
-    
-    store_c = Store("Amazon")
-    store_c.set_price("Pens", 1.00)
-    store_c.set_price("Paper Reams", 7.50)
-    store_c.set_price("Staplers", 4.00)
-    store_c.set_price("Folders", 0.45)
-    store_c.set_price("Markers", 1.80)
-    
-    # Add stores to the system
-    smart_list.add_store(store_a)
-    smart_list.add_store(store_b)
-    smart_list.add_store(store_c)
+    # Load 4 offices and 3 stores
+    load_sample_data(smart_list)
     
     # Display merged shopping list
     print("=" * 60)
     print("SMART SHOPPING LIST - CONSOLIDATED FROM 4 OFFICES")
     print("=" * 60)
     merged = smart_list.merge_supplies()
+    sorted_items = sorted(merged.items())  # shared by the list and the breakdown
     print("\nMerged Shopping List:")
-    for item, quantity in sorted(merged.items()):
+    for item, quantity in sorted_items:
         print(f"  - {item}: {quantity}")
     
     # Display price comparison
@@ -192,7 +432,7 @@ def demo():
     print("PRICE COMPARISON BY STORE")
     print("=" * 60)
     comparison = smart_list.get_price_comparison()
-    for store_name, data in sorted(comparison.items()):
+    for store_name, data in comparison.items():
         print(f"\n{store_name}:")
         if data['unavailable_items']:
             print(f"  Status: Unavailable items - {', '.join(data['unavailable_items'])}")
@@ -211,8 +451,9 @@ def demo():
         
         # Show itemized breakdown
         print("\nItemized Breakdown:")
-        for item, quantity in sorted(merged.items()):
-            price = cheapest_store.get_price(item)
+        prices = cheapest_store.prices  # the cheapest store carries every item
+        for item, quantity in sorted_items:
+            price = prices[item]
             subtotal = price * quantity
             print(f"  - {item}: {quantity} x ${price:.2f} = ${subtotal:.2f}")
     else:
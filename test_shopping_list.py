@@ -3,8 +3,12 @@
 Unit tests for Smart Shopping List Application
 """
 
+import os
+import subprocess
+import sys
 import unittest
-from shopping_list import Office, Store, SmartShoppingList
+import shopping_list
+from shopping_list import Office, Store, SmartShoppingList, load_sample_data
 
 
 class TestOffice(unittest.TestCase):
@@ -28,6 +32,15 @@ class TestOffice(unittest.TestCase):
         supplies = office.get_supplies()
         self.assertEqual(supplies["Pens"], 5)
         self.assertEqual(supplies["Paper"], 10)
+    
+    def test_get_supplies_is_read_only(self):
+        office = Office("Test Office")
+        office.add_item("Pens", 5)
+        supplies = office.get_supplies()
+        with self.assertRaises(TypeError):
+            supplies["Pens"] = 1
+        office.add_item("Pens", 1)
+        self.assertEqual(supplies["Pens"], 6)
 
 
 class TestStore(unittest.TestCase):
@@ -38,9 +51,24 @@ class TestStore(unittest.TestCase):
         store.set_price("Pens", 1.50)
         self.assertEqual(store.get_price("Pens"), 1.50)
     
+    def test_item_names_are_interned(self):
+        office = Office("Test Office")
+        office.add_item("".join(["Pe", "ns"]), 5)
+        store = Store("Test Store")
+        store.set_price("".join(["Pen", "s"]), 1.50)
+        self.assertIs(next(iter(office.supplies)), next(iter(store.prices)))
+    
     def test_get_unavailable_item_price(self):
         store = Store("Test Store")
         self.assertEqual(store.get_price("NonexistentItem"), float('inf'))
+    
+    def test_no_instance_dict(self):
+        store = Store("Test Store")
+        office = Office("Test Office")
+        with self.assertRaises(AttributeError):
+            store.address = "Main St"
+        with self.assertRaises(AttributeError):
+            office.address = "Main St"
 
 
 class TestSmartShoppingList(unittest.TestCase):
@@ -70,6 +98,19 @@ class TestSmartShoppingList(unittest.TestCase):
         self.store2.set_price("Paper", 4.00)
         self.store2.set_price("Folders", 0.75)
     
+    def add_catalog(self, n_items, n_stores, gap):
+        """Add one office per item and n_stores stores, each missing a few items."""
+        for i in range(n_items):
+            office = Office(f"Office {i}")
+            office.add_item(f"Item {i}", i + 1)
+            self.smart_list.add_office(office)
+        for i in range(n_stores):
+            store = Store(f"Store {i}")
+            for j in range(n_items):
+                if (i + j) % gap:
+                    store.set_price(f"Item {j}", (i * j) % 7 + 0.25)
+            self.smart_list.add_store(store)
+    
     def test_merge_supplies_from_multiple_offices(self):
         self.smart_list.add_office(self.office1)
         self.smart_list.add_office(self.office2)
@@ -84,6 +125,17 @@ class TestSmartShoppingList(unittest.TestCase):
         merged = self.smart_list.merge_supplies()
         self.assertEqual(merged, {})
     
+    def test_merge_supplies_cache_invalidation(self):
+        self.smart_list.add_office(self.office1)
+        self.assertEqual(self.smart_list.merge_supplies()["Pens"], 10)
+        
+        self.smart_list.add_office(self.office2)
+        self.assertEqual(self.smart_list.merge_supplies()["Pens"], 15)
+        
+        # Changing an office that is already added also refreshes the list
+        self.office1.add_item("Pens", 2)
+        self.assertEqual(self.smart_list.merge_supplies()["Pens"], 17)
+    
     def test_calculate_store_total(self):
         self.smart_list.add_office(self.office1)
         merged = self.smart_list.merge_supplies()
@@ -101,6 +153,85 @@ class TestSmartShoppingList(unittest.TestCase):
         
         self.assertIn("NonexistentItem", unavailable)
     
+    def test_calculate_store_total_stops_at_budget(self):
+        shopping_list = {"Pens": 10, "Paper": 5, "NonexistentItem": 5}
+        
+        total, unavailable = self.smart_list.calculate_store_total(self.store1, shopping_list, budget=10.00)
+        
+        # Stops after pens reach the budget, before reaching the missing item
+        self.assertEqual(total, 10.00)
+        self.assertEqual(unavailable, [])
+    
+    def test_compute_all(self):
+        self.smart_list.add_office(self.office1)
+        self.smart_list.add_office(self.office2)
+        self.smart_list.add_store(self.store1)
+        store3 = Store("Store C")
+        store3.set_price("Pens", 2.00)
+        self.smart_list.add_store(store3)
+        
+        merged, totals, unavailable = self.smart_list.compute_all()
+        
+        self.assertEqual(merged, {"Pens": 15, "Paper": 5, "Folders": 10})
+        self.assertEqual(totals[self.store1], 45.00)
+        self.assertEqual(unavailable[self.store1], [])
+        self.assertEqual(totals[store3], float('inf'))
+        self.assertEqual(unavailable[store3], ["Paper", "Folders"])
+    
+    def test_compute_all_reuses_merged_list(self):
+        self.smart_list.add_office(self.office1)
+        self.smart_list.add_store(self.store1)
+        merged = self.smart_list.merge_supplies()
+        
+        self.assertIs(self.smart_list.compute_all()[0], merged)
+        self.assertEqual(self.smart_list.compute_all()[1][self.store1], 35.00)
+    
+    def test_totals_do_not_depend_on_call_order(self):
+        for quantity in (1, 5):
+            office = Office(f"Office {quantity}")
+            office.add_item("Pens", quantity)
+            self.smart_list.add_office(office)
+        store = Store("Store C")
+        store.set_price("Pens", 0.1)
+        self.smart_list.add_store(store)
+        
+        # Priced before merge_supplies() has run; the merged quantity is priced once
+        comparison = self.smart_list.get_price_comparison()
+        self.assertEqual(comparison["Store C"]["total"], 0.1 * 6)
+        
+        store.set_price("Pens", 0.1)
+        self.smart_list.merge_supplies()
+        self.assertEqual(self.smart_list.get_price_comparison(), comparison)
+    
+    def test_compute_all_cache_invalidation(self):
+        self.smart_list.add_office(self.office1)
+        self.smart_list.add_store(self.store1)
+        self.assertEqual(self.smart_list.compute_all()[1][self.store1], 35.00)
+        
+        self.store1.set_price("Pens", 2.00)
+        self.assertEqual(self.smart_list.compute_all()[1][self.store1], 45.00)
+        
+        self.smart_list.add_store(self.store2)
+        self.assertIn(self.store2, self.smart_list.compute_all()[1])
+    
+    def test_infinite_price_is_unavailable(self):
+        self.smart_list.add_office(self.office1)
+        self.smart_list.add_store(self.store1)
+        self.store2.set_price("Pens", float('inf'))
+        self.smart_list.add_store(self.store2)
+        merged = self.smart_list.merge_supplies()
+        
+        total, unavailable = self.smart_list.calculate_store_total(self.store2, merged)
+        self.assertEqual(unavailable, ["Pens"])
+        
+        for comparison in (self.smart_list.get_price_comparison(),
+                           self.smart_list.get_price_comparison(dict(merged))):
+            self.assertEqual(comparison["Store B"]["total"], float('inf'))
+            self.assertEqual(comparison["Store B"]["unavailable_items"], ["Pens"])
+        
+        cheapest_store, total, _ = self.smart_list.find_cheapest_store()
+        self.assertEqual(cheapest_store.name, "Store A")
+    
     def test_find_cheapest_store(self):
         self.smart_list.add_office(self.office1)
         self.smart_list.add_office(self.office2)
@@ -114,6 +245,28 @@ class TestSmartShoppingList(unittest.TestCase):
         self.assertEqual(cheapest_store.name, "Store A")
         self.assertEqual(total, 45.00)
     
+    def test_find_cheapest_store_with_merged_list(self):
+        self.smart_list.add_store(self.store1)
+        self.smart_list.add_store(self.store2)
+        shopping_list = {"Paper": 10}
+        
+        cheapest_store, total, merged = self.smart_list.find_cheapest_store(shopping_list)
+        
+        self.assertEqual(cheapest_store.name, "Store B")
+        self.assertEqual(total, 40.00)
+        self.assertIs(merged, shopping_list)
+    
+    def test_find_cheapest_store_all_incomplete(self):
+        self.smart_list.add_office(self.office1)
+        store3 = Store("Store C")
+        store3.set_price("Pens", 2.00)
+        self.smart_list.add_store(store3)
+        
+        cheapest_store, total, merged = self.smart_list.find_cheapest_store()
+        
+        self.assertIsNone(cheapest_store)
+        self.assertEqual(total, float('inf'))
+    
     def test_find_cheapest_store_no_stores(self):
         self.smart_list.add_office(self.office1)
         
@@ -144,6 +297,115 @@ class TestSmartShoppingList(unittest.TestCase):
         self.assertEqual(comparison["Store A"]["total"], 35.00)
         self.assertEqual(comparison["Store B"]["total"], 35.00)
     
+    @unittest.skipIf(shopping_list.np is None, "NumPy not installed")
+    def test_price_matrix(self):
+        self.smart_list.add_office(self.office1)
+        self.smart_list.add_store(self.store1)
+        store3 = Store("Store C")
+        store3.set_price("Pens", 2.00)
+        self.smart_list.add_store(store3)
+        
+        items, quantities, prices = self.smart_list.price_matrix()
+        
+        self.assertEqual(items, ["Pens", "Paper"])
+        self.assertEqual(quantities.tolist(), [10.0, 5.0])
+        self.assertEqual(prices[0].tolist(), [1.00, 5.00])
+        self.assertEqual(prices[1][0], 2.00)
+        self.assertTrue(shopping_list.np.isnan(prices[1][1]))
+    
+    @unittest.skipIf(shopping_list.np is None, "NumPy not installed")
+    def test_vectorized_path_matches_python_path(self):
+        self.add_catalog(n_items=40, n_stores=30, gap=29)
+        # An infinite price means not available, on both paths
+        store = Store("Store Inf")
+        for j in range(40):
+            store.set_price(f"Item {j}", 0.25)
+        store.set_price("Item 0", float('inf'))
+        self.smart_list.add_store(store)
+        merged = self.smart_list.merge_supplies()
+        self.assertTrue(self.smart_list._use_numpy(merged))
+        
+        vectorized = self.smart_list.get_price_comparison()
+        cheapest = self.smart_list.find_cheapest_store()
+        self.assertEqual(vectorized["Store Inf"]["total"], float('inf'))
+        self.assertEqual(vectorized["Store Inf"]["unavailable_items"], ["Item 0"])
+        
+        original_np = shopping_list.np
+        shopping_list.np = None
+        store.set_price("Item 0", float('inf'))  # same price, but forces a recompute
+        try:
+            self.assertEqual(self.smart_list.get_price_comparison(), vectorized)
+            self.assertEqual(self.smart_list.find_cheapest_store(), cheapest)
+        finally:
+            shopping_list.np = original_np
+    
+    def test_get_price_comparison_cache(self):
+        self.smart_list.add_office(self.office1)
+        self.smart_list.add_store(self.store1)
+        
+        comparison = self.smart_list.get_price_comparison()
+        self.assertIs(self.smart_list.get_price_comparison(), comparison)
+        
+        self.smart_list.add_store(self.store2)
+        comparison = self.smart_list.get_price_comparison()
+        self.assertIn("Store B", comparison)
+        
+        self.store2.set_price("Pens", 0.50)
+        self.assertEqual(self.smart_list.get_price_comparison()["Store B"]["total"], 25.00)
+        self.assertEqual(self.smart_list.find_cheapest_store()[0].name, "Store B")
+    
+    def test_get_price_comparison_after_price_change(self):
+        self.smart_list.add_store(self.store1)
+        store3 = Store("Store C")
+        store3.set_price("Pens", 2.00)
+        self.smart_list.add_store(store3)
+        shopping_list = {"Pens": 10, "Paper": 5}
+        
+        comparison = self.smart_list.get_price_comparison(shopping_list)
+        self.assertEqual(comparison["Store A"]["total"], 35.00)
+        self.assertEqual(comparison["Store C"]["total"], float('inf'))
+        self.assertEqual(comparison["Store C"]["unavailable_items"], ["Paper"])
+        
+        store3.set_price("Paper", 1.00)
+        comparison = self.smart_list.get_price_comparison(shopping_list)
+        self.assertEqual(comparison["Store C"]["total"], 25.00)
+        self.assertEqual(comparison["Store C"]["unavailable_items"], [])
+    
+    def test_numba_not_imported_at_startup(self):
+        code = "import sys, shopping_list; print('numba' in sys.modules)"
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True,
+                                cwd=os.path.dirname(os.path.abspath(__file__)), check=True)
+        self.assertEqual(result.stdout.strip(), "False")
+    
+    def test_jit_store_totals(self):
+        store_totals = shopping_list._load_jit_store_totals()
+        if store_totals is None:
+            self.skipTest("Numba not installed")
+        np = shopping_list.np
+        prices = np.array([[1.00, 5.00], [2.00, np.nan], [1.50, 4.00], [np.inf, 1.00]])
+        quantities = np.array([10.0, 5.0])
+        
+        totals = store_totals(prices, quantities)
+        
+        self.assertEqual(totals.tolist(), [35.00, float('inf'), 35.00, float('inf')])
+    
+    def test_jit_path_matches_python_path(self):
+        if shopping_list._load_jit_store_totals() is None:
+            self.skipTest("Numba not installed")
+        self.add_catalog(n_items=100, n_stores=100, gap=97)
+        merged = dict(self.smart_list.merge_supplies())
+        
+        jit_cheapest = self.smart_list.find_cheapest_store(merged)
+        jit_comparison = self.smart_list.get_price_comparison(merged)
+        
+        original_np = shopping_list.np
+        shopping_list.np = None
+        try:
+            self.assertEqual(self.smart_list.find_cheapest_store(merged), jit_cheapest)
+            self.assertEqual(self.smart_list.get_price_comparison(merged), jit_comparison)
+        finally:
+            shopping_list.np = original_np
+    
     def test_four_offices_integration(self):
         """Integration test with 4 offices as per requirements."""
         office1 = Office("Office 1")
@@ -168,6 +430,18 @@ class TestSmartShoppingList(unittest.TestCase):
         
         self.assertEqual(merged["Pens"], 20)  # 5 + 10 + 5
         self.assertEqual(merged["Paper"], 10)  # 5 + 5
+    
+    def test_load_sample_data(self):
+        load_sample_data(self.smart_list)
+        
+        self.assertEqual(len(self.smart_list.offices), 4)
+        self.assertEqual(len(self.smart_list.stores), 3)
+        
+        cheapest_store, total, merged = self.smart_list.find_cheapest_store()
+        
+        self.assertEqual(cheapest_store.name, "Amazon")
+        self.assertEqual(total, 212.00)
+        self.assertEqual(merged["Pens"], 30)
 
 
 if __name__ == "__main__":